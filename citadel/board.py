@@ -1,18 +1,25 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, TypedDict, overload, Type, TypeVar
-import importlib
+from collections import deque
 
-from .util import Coordinate, Rectangle, BoolWithReason, Layer, ActionError
-from .entity import EntityList
+from .util import Coordinate, Rectangle, BoolWithReason, Layer, ActionError, _OK
+from .entity import Entity, EntityList, _entity_classes
 
 if TYPE_CHECKING:
-    from .entity import Entity
     from .piece import Piece, Land, Citadel
     from .game import Game
     from .player import Player
     T = TypeVar('T', bound=Entity)
 
 
+_LAYER_BELOW = {layer: Layer(layer.value - 1) for layer in Layer if layer.value > 0}
+
+def _entity_bases(entity_type:type) -> tuple[type, ...]:
+    '''The classes an entity type is indexed under: itself and its Entity ancestors.'''
+    mro = entity_type.__mro__
+    return mro[:mro.index(Entity) + 1]
+
+
 class Tile(EntityList):
     '''A single tile (location) on the board.
     '''
@@ -23,6 +30,10 @@ class Tile(EntityList):
             board: The board this tile is on.
             coordinate: The coordinate of this tile.
         '''
+        #: One bit per Layer, set while an entity of that layer is on this tile.
+        self._layer_mask:int = 0
+        # The first entity of each layer on this tile.
+        self._by_layer:dict[Layer, Entity] = {}
         super().__init__(board.game, name=f"{board.name}{coordinate}")
         self.board = board
         self.coordinate = coordinate
@@ -55,12 +66,12 @@ class Tile(EntityList):
         self = cls(board, Coordinate.from_json(json_data['coordinate']))
         self.name = json_data['name']
         entities = []
-        piece_module = importlib.import_module('.piece', package='citadel')
+        players = {player.name: player for player in self.game.players}
         for entity_data in json_data['entities']:
             entity_type = entity_data['type']
-            created_by = next((player for player in self.game.players if player.name == entity_data['created_by']), None)
-            owner = next((player for player in self.game.players if player.name == entity_data['owner']), None)
-            entity = getattr(piece_module, entity_type)(self, created_by, owner)
+            created_by = players.get(entity_data['created_by'])
+            owner = players.get(entity_data['owner'])
+            entity = _entity_classes[entity_type](self, created_by, owner)
             entities.append(entity)
         self.extend(entities)
         return self
@@ -79,10 +90,45 @@ class Tile(EntityList):
     def append(self, entity:Entity, reset_location:bool=True):
         can_add = self.can_add(entity)
         if can_add:
-            super().append(entity, reset_location)
-            self.board[self.coordinate] = self
+            self._unchecked_append(entity, reset_location)
         else:
             raise ActionError(f"Cannot add {entity.__class__.__name__} to tile at {self.coordinate}: {can_add}")
+
+
+    def _unchecked_append(self, entity:Entity, reset_location:bool=True):
+        '''Append an entity that the caller has already checked with can_add.
+        '''
+        super().append(entity, reset_location)
+        self.board[self.coordinate] = self
+    
+
+    def _on_add(self, entity:Entity):
+        super()._on_add(entity)
+        self._layer_mask |= entity._layer_bit
+        self._by_layer.setdefault(entity.layer, entity)
+        self.board._register(entity, self.coordinate)
+    
+
+    def _on_remove(self, entity:Entity):
+        super()._on_remove(entity)
+        self._layer_mask &= ~entity._layer_bit
+        if self._by_layer.get(entity.layer) is entity:
+            del self._by_layer[entity.layer]
+            for other in self:
+                if other.layer == entity.layer:
+                    self._by_layer[other.layer] = other
+                    self._layer_mask |= other._layer_bit
+                    break
+        self.board._unregister(entity)
+    
+
+    def _reindex(self):
+        for bucket in self._by_type.values():
+            for entity in bucket:
+                self.board._unregister(entity)
+        self._layer_mask = 0
+        self._by_layer = {}
+        super()._reindex()
     
 
     def can_add(self, entity:Entity) -> BoolWithReason:
@@ -94,15 +140,14 @@ class Tile(EntityList):
         Args:
             entity: The entity to add.
         '''
-        if self.get_by_layer(entity.layer):
+        if self._layer_mask & entity._layer_bit:
             return BoolWithReason(f"layer {entity.layer.name} already occupied by {self.get_by_layer(entity.layer)}")
         
-        if entity.layer.value > 0:
-            layer_below = Layer(entity.layer.value - 1)
-            if not self.get_by_layer(layer_below):
-                return BoolWithReason(f"{entity.layer.name}-layer entities must be placed on top of a {layer_below.name}-layer entity")
+        if entity._support_bit and not self._layer_mask & entity._support_bit:
+            layer_below = _LAYER_BELOW[entity.layer]
+            return BoolWithReason(f"{entity.layer.name}-layer entities must be placed on top of a {layer_below.name}-layer entity")
     
-        return BoolWithReason(True)
+        return _OK
     
 
     def get_by_layer(self, layer:Layer) -> 'Entity'|None:
@@ -111,10 +156,7 @@ class Tile(EntityList):
         Args:
             layer: The layer to get.
         '''
-        for entity in self:
-            if entity.layer == layer:
-                return entity
-        return None
+        return self._by_layer.get(layer)
 
     
 
@@ -123,10 +165,7 @@ class Tile(EntityList):
         '''The land tile on this tile, if any.
         '''
         from .piece import Land
-        for entity in self:
-            if isinstance(entity, Land):
-                return entity
-        return None
+        return self.get_by_type(Land)
     
 
     @property
@@ -134,10 +173,7 @@ class Tile(EntityList):
         '''The first piece on this tile, if any.
         '''
         from .piece import Piece
-        for entity in self:
-            if isinstance(entity, Piece):
-                return entity
-        return None
+        return self.get_by_type(Piece)
     
 
     @property
@@ -145,10 +181,7 @@ class Tile(EntityList):
         '''The citadel on this tile, if any.
         '''
         from .piece import Citadel
-        for entity in self:
-            if isinstance(entity, Citadel):
-                return entity
-        return None
+        return self.get_by_type(Citadel)
 
 
     @property
@@ -167,12 +200,14 @@ class Tile(EntityList):
     def get_adjacent_tiles(self, orthagonal:bool=True, diagonal:bool=True) -> list['Tile']:
         '''Get the tiles adjacent to this tile.
 
+        Adjacent coordinates without a tile are represented by shared empty tiles, which must not be modified.
+
         Args:
             orthagonal: If True, include orthagonal tiles.
             diagonal: If True, include diagonal tiles.
         '''
         coordinates = self.coordinate.get_adjacent_coordinates(orthagonal, diagonal)
-        return self.board[coordinates]
+        return self.board[list(coordinates)]
     
     
     @property
@@ -220,6 +255,28 @@ class Board(dict[Coordinate, 'Tile']):
         self.name = name
         self.game:Game = game
         self.default_tile_color = "#87CEEB"
+        # Indexes over the entities on the board, maintained as tiles gain and lose entities.
+        # The inner dicts are used as insertion-ordered sets.
+        self._by_type:dict[type, dict[Entity, None]] = {}
+        self._by_creator:dict[Player|None, dict[Entity, None]] = {}
+        self._by_layer:dict[Layer, dict[Entity, None]] = {}
+        self._entity_coord:dict[Entity, Coordinate] = {}
+        # Disjoint-set forest over the coordinates that have a TERRAIN-layer entity.
+        self._dsu_parent:dict[Coordinate, Coordinate] = {}
+        self._dsu_rank:dict[Coordinate, int] = {}
+        #: Incremented whenever a citadel is added to or removed from the board.
+        self.citadel_version:int = 0
+        self._citadel_counts:dict[Player|None, int] = {}
+        self._land_counts:dict[Player|None, int] = {}
+        self._empty_tiles:dict[Coordinate, Tile] = {}
+        # The position of each coordinate in the board's iteration order, maintained by __setitem__ and __delitem__.
+        self._coordinate_order:dict[Coordinate, int] = {}
+        self._next_coordinate_order:int = 0
+        # The bounds of the tile coordinates, maintained by __setitem__ and __delitem__.
+        self._min_x:int|None = None
+        self._max_x:int|None = None
+        self._min_y:int|None = None
+        self._max_y:int|None = None
     
 
     class BoardJson(TypedDict):
@@ -273,6 +330,8 @@ class Board(dict[Coordinate, 'Tile']):
     def __getitem__(self, coordinates:list[Coordinate|tuple[int, int]]) -> list['Tile']:
         '''Get the tiles at the given coordinates.
 
+        Empty coordinates share a cached empty Tile per coordinate, so the result is for reading only.
+
         Args:
             coordinates: The coordinates to get the tiles at.
         '''
@@ -282,24 +341,37 @@ class Board(dict[Coordinate, 'Tile']):
             for coord in coordinate:
                 if not isinstance(coord, Coordinate):
                     coord = Coordinate(*coord)
-                res.append(self.get(coord, Tile(self, coord)))
+                tile = self.get(coord)
+                res.append(tile if tile is not None else self._empty_tile(coord))
             return res
-        elif isinstance(coordinate, Coordinate):
-            return super().get(coordinate, Tile(self, coordinate))
         elif isinstance(coordinate, tuple):
-            coord = Coordinate(*coordinate)
-            return super().get(coord, Tile(self, coord))
+            if not isinstance(coordinate, Coordinate):
+                coordinate = Coordinate(*coordinate)
+            tile = super().get(coordinate)
+            if tile is not None:
+                return tile
+            # A new Tile is returned here, not the shared empty one, since callers may add entities to it.
+            return Tile(self, coordinate)
         else:
             raise TypeError(f"Coordinate must be a Coordinate or list of Coordinates, not {type(coordinate)}.")
         
     
+    def _empty_tile(self, coordinate:Coordinate) -> 'Tile':
+        '''Get the shared, read-only empty Tile for a coordinate that has no tile.
+        '''
+        tile = self._empty_tiles.get(coordinate)
+        if tile is None:
+            tile = self._empty_tiles[coordinate] = Tile(self, coordinate)
+        return tile
+        
+    
     def __contains__(self, key):
         if isinstance(key, Coordinate):
             return super().__contains__(key)
         elif isinstance(key, Tile):
             return super().__contains__(key.coordinate)
         elif isinstance(key, Entity):
-            return self.get_coordinate_of_entity(key) is not None
+            return key in self._entity_coord
         else:
             raise TypeError(f"Key must be a Coordinate, Tile, or Entity, not {type(key)}.")
         
@@ -340,10 +412,7 @@ class Board(dict[Coordinate, 'Tile']):
         Args:
             entity: The entity to get the coordinate of.
         '''
-        for coordinate, tile in self.items():
-            if entity in tile:
-                return coordinate
-        return None
+        return self._entity_coord.get(entity)
     
 
     def remove(self, entity:'Entity') -> 'Entity':
@@ -361,6 +430,15 @@ class Board(dict[Coordinate, 'Tile']):
         self.on_update()
     
 
+    def has_type(self, entity_type:Type['Entity']) -> bool:
+        '''Check if the board has an entity of the given type.
+
+        Args:
+            entity_type: The type of entity to check for.
+        '''
+        return bool(self._by_type.get(entity_type))
+
+
     def where(self,
         entity_type:Type[T]=Type['Entity'],
         created_by:Player|None=None,
@@ -369,6 +447,7 @@ class Board(dict[Coordinate, 'Tile']):
         '''Search for entities on the board.
 
         If any arguments are not provided, all entities for that parameter are returned.
+        Entities are returned in board order: by tile, then bottom to top within a tile.
         
         Args:
             entity_type: The type of entity to find.
@@ -376,9 +455,30 @@ class Board(dict[Coordinate, 'Tile']):
             owner: The player who owns the entity.
             layer: The layer of the entity.
         '''
+        candidates = []
+        if isinstance(entity_type, type):
+            candidates.append(self._by_type.get(entity_type, {}))
+        if created_by:
+            candidates.append(self._by_creator.get(created_by, {}))
+        if layer:
+            candidates.append(self._by_layer.get(layer, {}))
+        if not candidates:
+            candidates.append(self._entity_coord)
+        candidates.sort(key=len)
+        smallest, others = candidates[0], candidates[1:]
+        found = [
+            entity for entity in smallest
+            if all(entity in other for other in others) and not (owner and entity.owner != owner)
+            ]
+        if len(found) > 1:
+            # The indexes are in registration order, which changes as entities move.
+            order = self._coordinate_order
+            def board_order(entity:Entity):
+                coordinate = self._entity_coord[entity]
+                return order[coordinate], dict.__getitem__(self, coordinate).index(entity)
+            found.sort(key=board_order)
         entities = EntityList(self.game)
-        for tile in self.values():
-            entities.extend(tile.where(entity_type, created_by, owner, layer))
+        entities.extend(found)
         return entities
 
 
@@ -389,25 +489,130 @@ class Board(dict[Coordinate, 'Tile']):
         '''Search for tiles on the board.
 
         If any arguments are not provided, all entities for that parameter are returned.
+        Tiles are returned in board order, once per matching entity.
         
         Args:
             entity_type: The type of entity to find.
             created_by: The player who created the entity.
             layer: The layer of the entity.
         '''
-        tiles = []
-        for tile in self.values():
-            for entity in tile:
-                if not isinstance(entity, entity_type):
-                    continue
-                if created_by and entity.created_by != created_by:
-                    continue
-                if layer and entity.layer != layer:
-                    continue
-                tiles.append(tile)
-        return tiles
+        return [self[self._entity_coord[entity]] for entity in self.where(entity_type, created_by, layer=layer)]
     
 
+    def _register(self, entity:Entity, coordinate:Coordinate):
+        '''Add an entity to the board's indexes.
+
+        Args:
+            entity: The entity that was added to a tile.
+            coordinate: The coordinate of the tile.
+        '''
+        self._entity_coord[entity] = coordinate
+        for cls in _entity_bases(type(entity)):
+            self._by_type.setdefault(cls, {})[entity] = None
+        self._by_creator.setdefault(entity.created_by, {})[entity] = None
+        self._by_layer.setdefault(entity.layer, {})[entity] = None
+        if entity.layer == Layer.TERRAIN:
+            self._dsu_add(coordinate)
+        from .piece import Citadel, Land
+        if isinstance(entity, Citadel):
+            self.citadel_version += 1
+            self._citadel_counts[entity.owner] = self._citadel_counts.get(entity.owner, 0) + 1
+        elif isinstance(entity, Land):
+            self._land_counts[entity.created_by] = self._land_counts.get(entity.created_by, 0) + 1
+
+
+    def _unregister(self, entity:Entity):
+        '''Remove an entity from the board's indexes.
+
+        Args:
+            entity: The entity that was removed from a tile.
+        '''
+        coordinate = self._entity_coord.pop(entity, None)
+        for cls in _entity_bases(type(entity)):
+            self._by_type[cls].pop(entity, None)
+        self._by_creator.get(entity.created_by, {}).pop(entity, None)
+        self._by_layer.get(entity.layer, {}).pop(entity, None)
+        if entity.layer == Layer.TERRAIN and coordinate is not None:
+            self._dsu_remove(coordinate)
+        from .piece import Citadel, Land
+        if isinstance(entity, Citadel):
+            self.citadel_version += 1
+            self._citadel_counts[entity.owner] -= 1
+        elif isinstance(entity, Land):
+            self._land_counts[entity.created_by] -= 1
+
+
+    def _dsu_find(self, coordinate:Coordinate) -> Coordinate:
+        '''Find the representative of the terrain component containing a coordinate.
+
+        Coordinates without terrain are their own component.
+
+        Args:
+            coordinate: The coordinate to look up.
+        '''
+        parent = self._dsu_parent
+        if coordinate not in parent:
+            return coordinate
+        while parent[coordinate] != coordinate:
+            parent[coordinate] = parent[parent[coordinate]]
+            coordinate = parent[coordinate]
+        return coordinate
+
+
+    def _dsu_union(self, a:Coordinate, b:Coordinate):
+        '''Merge the terrain components containing two coordinates.
+        '''
+        root_a, root_b = self._dsu_find(a), self._dsu_find(b)
+        if root_a == root_b:
+            return
+        if self._dsu_rank[root_a] < self._dsu_rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self._dsu_parent[root_b] = root_a
+        if self._dsu_rank[root_a] == self._dsu_rank[root_b]:
+            self._dsu_rank[root_a] += 1
+
+
+    def _dsu_add(self, coordinate:Coordinate):
+        '''Add a terrain coordinate, joining it to its orthogonal terrain neighbors.
+        '''
+        if coordinate in self._dsu_parent:
+            return
+        self._dsu_parent[coordinate] = coordinate
+        self._dsu_rank[coordinate] = 0
+        for adjacent in coordinate.get_adjacent_coordinates(diagonal=False):
+            if adjacent in self._dsu_parent:
+                self._dsu_union(coordinate, adjacent)
+
+
+    def _dsu_remove(self, coordinate:Coordinate):
+        '''Remove a terrain coordinate, splitting its component if needed.
+
+        A disjoint-set cannot undo a union, so the rest of the old component is relabelled
+        with an iterative breadth-first search from each orthogonal terrain neighbor.
+        The rest of the board is untouched.
+        '''
+        parent, rank = self._dsu_parent, self._dsu_rank
+        if coordinate not in parent:
+            return
+        del parent[coordinate]
+        del rank[coordinate]
+        visited = set()
+        for start in coordinate.get_adjacent_coordinates(diagonal=False):
+            if start not in parent or start in visited:
+                continue
+            visited.add(start)
+            queue = deque([start])
+            while queue:
+                current = queue.popleft()
+                parent[current] = start
+                rank[current] = 0
+                for adjacent in current.get_adjacent_coordinates(diagonal=False):
+                    if adjacent in parent and adjacent not in visited:
+                        visited.add(adjacent)
+                        queue.append(adjacent)
+            rank[start] = 1
+
+
     @property
     def citadels(self) -> 'EntityList[Citadel]':
         '''The citadels on the board.
@@ -416,76 +621,170 @@ class Board(dict[Coordinate, 'Tile']):
         return self.where(Citadel)
 
 
+    def count_citadels(self, owner:Player|None) -> int:
+        '''The number of citadels on the board owned by the given player.
+
+        Args:
+            owner: The player whose citadels to count.
+        '''
+        return self._citadel_counts.get(owner, 0)
+
+
+    def count_lands(self, created_by:Player|None) -> int:
+        '''The number of lands on the board created by the given player.
+
+        Args:
+            created_by: The player whose lands to count.
+        '''
+        return self._land_counts.get(created_by, 0)
+
+
     @property
     def citadels_are_connected(self) -> bool:
         '''True if all citadels are connected to each other by a series of land tiles.
         
         Diagonals do no count, but Turtles do. This value is also True if there are not at least 2 citadels on the board.
         '''
-        if len(self.citadels) <= 1:
+        return self.citadels_connected_with()
+
+
+    def citadels_connected_with(self, coordinate:Coordinate|None=None) -> bool:
+        '''True if all citadels would be connected with an additional citadel at the given coordinate.
+
+        Args:
+            coordinate: Where a citadel would be added. If None, only the citadels already on the board are checked.
+        '''
+        from .piece import Citadel
+        coordinates = [self._entity_coord[citadel] for citadel in self._by_type.get(Citadel, {})]
+        if coordinate is not None:
+            coordinates.append(coordinate)
+        if len(coordinates) <= 1:
             return True
+        return len({self._dsu_find(c) for c in coordinates}) == 1
+
+
+    def citadels_connected_after_move(self, entity:Entity, coordinate:Coordinate) -> bool:
+        '''True if all citadels would be connected after moving an entity to the given coordinate.
+
+        The board is not changed.
+
+        Args:
+            entity: The entity that would move.
+            coordinate: Where the entity would move to.
+        '''
         from .piece import Citadel
-        starting_citadel = self.find_tiles(Citadel)[0]
-        connected_citadels = set()
-        checked_tiles = set()
-        def walk(tile:Tile):
-            if tile in checked_tiles:
-                return
-            checked_tiles.add(tile)
-            if tile.has_type(Citadel):
-                connected_citadels.add(tile.citadel)
-            if len(connected_citadels) == len(self.citadels):
-                return
-            if tile.get_by_layer(Layer.TERRAIN):
-                for adjacent_tile in tile.get_adjacent_tiles(diagonal=False):
-                    walk(adjacent_tile)
-        walk(starting_citadel)
-        return len(connected_citadels) == len(self.citadels)
+        origin = self._entity_coord.get(entity)
+        citadels = [self._entity_coord[citadel] for citadel in self._by_type.get(Citadel, {}) if citadel is not entity]
+        if isinstance(entity, Citadel):
+            citadels.append(coordinate)
+        if len(citadels) <= 1:
+            return True
+        if entity.layer != Layer.TERRAIN:
+            return len({self._dsu_find(c) for c in citadels}) == 1
+        # Moving terrain can split a component, which the disjoint-set can't answer,
+        # so search the terrain that would remain from one of the citadels.
+        terrain = self._dsu_parent
+        def is_terrain(c:Coordinate) -> bool:
+            return c == coordinate or (c in terrain and c != origin)
+        start = citadels[0]
+        visited = {start}
+        queue = deque([start] if is_terrain(start) else [])
+        while queue:
+            current = queue.popleft()
+            for adjacent in current.get_adjacent_coordinates(diagonal=False):
+                if adjacent not in visited and is_terrain(adjacent):
+                    visited.add(adjacent)
+                    queue.append(adjacent)
+        return all(c in visited for c in citadels)
 
 
     @property
     def extents(self) -> Rectangle:
         '''The extents of the board. The extents are the minimum and maximum x and y coordinates of the tiles on the board.
         '''
-        min_x = min_y = None
-        max_x = max_y = None
+        if self._min_x is None:
+            return Rectangle(0, 0, 0, 0)
+        return Rectangle(self._min_x, self._max_x, self._min_y, self._max_y)
+
+
+    def __setitem__(self, coordinate:Coordinate, tile:Tile):
+        if coordinate not in self._coordinate_order:
+            # Replacing a tile keeps its place in the dict, so only new coordinates are numbered.
+            self._coordinate_order[coordinate] = self._next_coordinate_order
+            self._next_coordinate_order += 1
+        super().__setitem__(coordinate, tile)
+        if self._min_x is None:
+            self._min_x = self._max_x = coordinate.x
+            self._min_y = self._max_y = coordinate.y
+            return
+        if coordinate.x < self._min_x:
+            self._min_x = coordinate.x
+        elif coordinate.x > self._max_x:
+            self._max_x = coordinate.x
+        if coordinate.y < self._min_y:
+            self._min_y = coordinate.y
+        elif coordinate.y > self._max_y:
+            self._max_y = coordinate.y
+
+
+    def __delitem__(self, coordinate:Coordinate):
+        super().__delitem__(coordinate)
+        del self._coordinate_order[coordinate]
+        if coordinate.x in (self._min_x, self._max_x) or coordinate.y in (self._min_y, self._max_y):
+            self._recompute_extents()
+
+
+    def _recompute_extents(self):
+        '''Recompute the extents from scratch, after a tile on the boundary was removed.
+        '''
+        self._min_x = self._max_x = self._min_y = self._max_y = None
         for coordinate in self.keys():
-            if min_x is None or coordinate.x < min_x:
-                min_x = coordinate.x
-            if max_x is None or coordinate.x > max_x:
-                max_x = coordinate.x
-            if min_y is None or coordinate.y < min_y:
-                min_y = coordinate.y
-            if max_y is None or coordinate.y > max_y:
-                max_y = coordinate.y
-
-        return Rectangle(min_x or 0, max_x or 0, min_y or 0, max_y or 0)
+            if self._min_x is None:
+                self._min_x = self._max_x = coordinate.x
+                self._min_y = self._max_y = coordinate.y
+                continue
+            self._min_x = min(self._min_x, coordinate.x)
+            self._max_x = max(self._max_x, coordinate.x)
+            self._min_y = min(self._min_y, coordinate.y)
+            self._max_y = max(self._max_y, coordinate.y)
     
 
     def _repr_html_(self) -> str:
         '''Get a string representation of the board for debugging.
         '''
-        if self.extents.x_min is None:
+        extents = self.extents
+        if extents.x_min is None:
             return "<p>Board is empty</p>"
-        rows = []
-        if self.extents.x_min < -100 or self.extents.x_max > 100:
-            raise ValueError(f"Board is too large to display in HTML (x: {self.extents.x_min} - {self.extents.x_max}). Use a smaller board.")
-        if self.extents.y_min < -100 or self.extents.y_max > 100:
-            raise ValueError(f"Board is too large to display in HTML (y: {self.extents.y_min} - {self.extents.y_max}). Use a smaller board.")
+        if extents.x_min < -100 or extents.x_max > 100:
+            raise ValueError(f"Board is too large to display in HTML (x: {extents.x_min} - {extents.x_max}). Use a smaller board.")
+        if extents.y_min < -100 or extents.y_max > 100:
+            raise ValueError(f"Board is too large to display in HTML (y: {extents.y_min} - {extents.y_max}). Use a smaller board.")
         
-        first_row = []
-        for y in range(int(self.extents.y_min), int(self.extents.y_max) + 1):
-            first_row.append(f"<th>y{y}</th>")
-        rows.append(f"<tr style='height: 36px;'><th></th>{''.join(first_row)}</tr>")
+        # The cell styling is shared, so it is written once instead of inline on every cell.
+        html = [
+            "<style>"
+            "table.citadel-board { table-layout: fixed; }"
+            "table.citadel-board tr { height: 60px; }"
+            "table.citadel-board tr.header { height: 36px; }"
+            "table.citadel-board td { width: 58px; height: 58px; border: 1px solid white; color: black; text-align: center; font-size: 1.5rem; padding: 0; margin: 0; }"
+            "</style>"
+            "<table class='citadel-board'><tr class='header'><th></th>"
+            ]
+        y_range = range(int(extents.y_min), int(extents.y_max) + 1)
+        for y in y_range:
+            html.append(f"<th>y{y}</th>")
+        html.append("</tr>")
         
-        for x in range(int(self.extents.x_min), int(self.extents.x_max) + 1):
-            cells = []
-            for y in range(int(self.extents.y_min), int(self.extents.y_max) + 1):
-                coordinate = Coordinate(x, y)
-                color, abbreviation, rotation = self[coordinate].short_html
-                cells.append(f"<td style='background-color: {color}; transform: rotate({rotation}deg); width: 58px; height 58px; border: 1px solid white; color: black; text-align: center; font-size: 1.5rem; padding: 0; margin: 0;'>{abbreviation}</td>")
-            rows.append(f"<tr style='height: 60px;'><th>x{x}</th>{''.join(cells)}</tr>")
-        return f"<table style='table-layout: fixed;'>{''.join(rows)}</table>"
+        empty_cell = (self.default_tile_color, " ", "0")
+        for x in range(int(extents.x_min), int(extents.x_max) + 1):
+            html.append(f"<tr><th>x{x}</th>")
+            for y in y_range:
+                tile = self.get(Coordinate(x, y))
+                color, abbreviation, rotation = tile.short_html if tile is not None else empty_cell
+                html.append(f"<td style='background-color: {color}; transform: rotate({rotation}deg);'>{abbreviation}</td>")
+            html.append("</tr>")
+        html.append("</table>")
+        return ''.join(html)
     
 
     def get_vector(self, start:Coordinate, end:Coordinate) -> Vector:
@@ -506,11 +805,14 @@ class Board(dict[Coordinate, 'Tile']):
         Args:
             entity: The entity to get the equivalent of.
         '''
-
-        for tile in self.values():
-            if tile.get_equivalent_entity(entity):
-                return tile.get_equivalent_entity(entity)
-        return None
+        # Only the tile at the entity's coordinate can hold its equivalent.
+        coordinate = entity.coordinate
+        if coordinate is None:
+            return None
+        tile = self.get(coordinate)
+        if tile is None:
+            return None
+        return tile.get_equivalent_entity(entity)
 
 
     def on_update(self):
@@ -520,6 +822,8 @@ class Board(dict[Coordinate, 'Tile']):
 
 class Vector():
     '''An object that represents two coordinates on the board, where one of them is the starting coordinate.'''
+    __slots__ = ('board', 'start', 'end')
+
     def __init__(self, board:Board, start:Coordinate, end:Coordinate):
         '''Create a new vector.
 
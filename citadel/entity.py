@@ -1,8 +1,9 @@
 from __future__ import annotations
-from typing import Generic, TypeVar, TypedDict, Iterator, TYPE_CHECKING, Type
+from typing import Generic, TypeVar, TypedDict, Iterable, Iterator, TYPE_CHECKING, Type
 from abc import abstractmethod, ABC
+from collections import deque
 from .util import BoolWithReason, Layer, Coordinate
-import importlib
+import itertools
 
 
 if TYPE_CHECKING:
@@ -12,6 +13,11 @@ if TYPE_CHECKING:
     from .piece import ActionList
 
 
+_type_ids = itertools.count(1)
+# Entity classes by name, for loading entities from JSON.
+_entity_classes:dict[str, type[Entity]] = {}
+
+
 class Entity(ABC):
     '''An game object that can be placed on a tile.
 
@@ -20,9 +26,29 @@ class Entity(ABC):
         owner: The player who owns this entity.
         location: The EntityList this entity is in.
     '''
+    __slots__ = ('created_by', 'owner', 'location', 'game')
     layer:Layer = Layer.PIECE
     abbreviation:str = " "
     img:str = ""
+    #: The Tile occupancy bit for this class's layer.
+    _layer_bit:int = 1 << Layer.PIECE.value
+    #: The Tile occupancy bit this class must be placed on top of, or 0 if none.
+    _support_bit:int = _layer_bit >> 1
+    #: A bit unique to this class.
+    _type_bit:int = 1
+    #: The _type_bit of this class and every Entity class it inherits from.
+    #: `a._ancestor_mask & b._type_bit` is equivalent to `issubclass(a, b)`.
+    _ancestor_mask:int = 1
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._layer_bit = 1 << cls.layer.value
+        cls._support_bit = cls._layer_bit >> 1
+        cls._type_bit = 1 << next(_type_ids)
+        cls._ancestor_mask = 0
+        for base in cls.__mro__:
+            cls._ancestor_mask |= base.__dict__.get('_type_bit', 0)
+        _entity_classes[cls.__name__] = cls
 
     def __init__(self, location:EntityList, created_by:Player|None=None, owner:Player|None=None):
         self.created_by:Player|None = created_by
@@ -120,52 +146,73 @@ class Entity(ABC):
         '''
     
 
-    def place(self, target:Tile, player:Player):
+    def place(self, target:Tile, player:Player, validate:bool=True):
         '''Place this entity on the given tile.
 
         Args:
             target: The tile to place the entity on.
             player: The player placing the entity.
+            validate: If false, skip the placement checks.
         '''
-        self.game.place(self, target, player)
+        self.game.place(self, target, player, validate)
     
 
-    def capture(self, target:Tile, player:Player):
+    def capture(self, target:Tile, player:Player, validate:bool=True):
         '''Capture the entity at the given tile.
 
         Args:
             target: The tile to capture the entity on.
             player: The player using the entity to capture the target.
+            validate: If false, skip the capture checks.
         '''
-        self.game.capture(self, target, player)
+        self.game.capture(self, target, player, validate)
     
 
-    def move(self, target:Tile, player:Player):
+    def move(self, target:Tile, player:Player, validate:bool=True):
         '''Move this entity to the given tile.
 
         Args:
             target: The tile to move the entity to.
             player: The player moving the entity.
+            validate: If false, skip the move checks.
         '''
-        self.game.move(self, target, player)
+        self.game.move(self, target, player, validate)
     
 
     def can_place(self, target:Tile, player:Player) -> BoolWithReason:
         return self.game.can_place(self, target, player)
     
 
+    def get_candidate_tiles(self, action_name:str) -> Iterable[Tile]:
+        '''Get the tiles that the given action could possibly be used on.
+
+        Subclasses narrow this down for actions with a fixed reach. By default, every tile on the board is a candidate.
+
+        Args:
+            action_name: The name of the action.
+        '''
+        return self.game.board.values()
+    
+
     def get_tiles_by_action(self, action_name:str) -> list[Tile]:
         '''Get the tiles that can be used with the given action.
 
+        The action list is built once and its check is reused for every candidate tile,
+        so this assumes the set of actions does not depend on the target tile.
+
         Args:
             action_name: The name of the action to get the tiles for.
         '''
         tiles = []
-        for tile in self.game.board.values():
-            actions = self.actions(tile, self.owner)
-            if action_name in actions:
-                if actions[action_name].can_use(tile, self.owner):
-                    tiles.append(tile)
+        action = None
+        for tile in self.get_candidate_tiles(action_name):
+            if action is None:
+                actions = self.actions(tile, self.owner)
+                if action_name not in actions:
+                    return tiles
+                action = actions[action_name]
+            if action.can_use(tile, self.owner):
+                tiles.append(tile)
         return tiles
     
 
@@ -197,7 +244,7 @@ class EntityList(list, Generic[T]):
     '''A collection of entities.
     '''
 
-    def __init__(self, game:Game, entities:list[T]=[], name:str|None=None):
+    def __init__(self, game:Game, entities:list[T]|None=None, name:str|None=None):
         '''Create a new entity list.
 
         Args:
@@ -205,9 +252,15 @@ class EntityList(list, Generic[T]):
             entities: The entities to add to the list.
             name: A unique name for this entity list.
         '''
-        super().__init__(entities)
+        super().__init__(entities if entities is not None else ())
         self.name = name
         self.game = game
+        #: The entities in this list, bucketed by their concrete type in list order.
+        self._by_type:dict[type, deque[T]] = {}
+        # The union of the ancestor masks of the types present, for has_type.
+        self._type_mask:int = 0
+        for entity in self:
+            self._on_add(entity)
 
     
     class EntityListJson(TypedDict):
@@ -235,12 +288,12 @@ class EntityList(list, Generic[T]):
         self = cls(game)
         self.name = json_data['name']
         entities = []
-        piece_module = importlib.import_module('.piece', package='citadel')
+        players = {player.name: player for player in game.players}
         for entity_data in json_data['entities']:
             entity_type = entity_data['type']
-            created_by = next((player for player in game.players if player.name == entity_data['created_by']), None)
-            owner = next((player for player in game.players if player.name == entity_data['owner']), None)
-            entity = getattr(piece_module, entity_type)(self, created_by, owner)
+            created_by = players.get(entity_data['created_by'])
+            owner = players.get(entity_data['owner'])
+            entity = _entity_classes[entity_type](self, created_by, owner)
             entities.append(entity)
         self.extend(entities)
         return self
@@ -286,7 +339,7 @@ class EntityList(list, Generic[T]):
         Args:
             entity_type: The type of entity to check for.
         '''
-        return any(isinstance(entity, entity_type) for entity in self)
+        return bool(self._type_mask & entity_type._type_bit)
     
 
     def where(self,
@@ -304,18 +357,22 @@ class EntityList(list, Generic[T]):
             owner: The player who owns the entity.
             layer: The layer of the entity.
         '''
-        entities = EntityList(self.game)
-        for entity in self:
-            if entity_type and not isinstance(entity, entity_type):
-                continue
-            if created_by and entity.created_by != created_by:
-                continue
-            if layer and entity.layer != layer:
-                continue
-            if owner and entity.owner != owner:
-                continue
-            entities.append(entity, reset_location=False)
-        return entities
+        candidates = self
+        bit = entity_type._type_bit if entity_type else 0
+        if bit:
+            buckets = [bucket for cls, bucket in self._by_type.items() if bucket and cls._ancestor_mask & bit]
+            if not buckets:
+                return EntityList(self.game)
+            if len(buckets) == 1:
+                # A single bucket is already in list order and holds only matching entities.
+                candidates = buckets[0]
+        return EntityList(self.game, [
+            entity for entity in candidates
+            if (not bit or entity._ancestor_mask & bit)
+            and (not created_by or entity.created_by is created_by)
+            and (not layer or entity.layer is layer)
+            and (not owner or entity.owner is owner)
+            ])
     
 
     def where_not(self,
@@ -333,18 +390,14 @@ class EntityList(list, Generic[T]):
             owner: The player who owns the entity to exclude.
             layer: The layer of the entity to exclude.
         '''
-        entities = EntityList(self.game)
-        for entity in self:
-            if entity_type and isinstance(entity, entity_type):
-                continue
-            if created_by and entity.created_by == created_by:
-                continue
-            if layer and entity.layer == layer:
-                continue
-            if owner and entity.owner == owner:
-                continue
-            entities.append(entity)
-        return entities
+        bit = entity_type._type_bit if entity_type else 0
+        return EntityList(self.game, [
+            entity for entity in self
+            if not (bit and entity._ancestor_mask & bit)
+            and not (created_by and entity.created_by is created_by)
+            and not (layer and entity.layer is layer)
+            and not (owner and entity.owner is owner)
+            ])
     
 
     def _repr_html_(self) -> str:
@@ -375,21 +428,131 @@ class EntityList(list, Generic[T]):
         if reset_location:
             object.location = self
         self.on_update()
-        return super().append(object)
+        super().append(object)
+        self._on_add(object)
+    
+
+    def extend(self, entities:list['Entity']):
+        '''Add entities to the end of the list without changing their location.
+        '''
+        entities = list(entities)
+        super().extend(entities)
+        for entity in entities:
+            self._on_add(entity)
+
+
+    def insert(self, index:int, object:'Entity'):
+        '''Insert an entity before the given index.
+        '''
+        super().insert(index, object)
+        self._on_add(object)
+        # Keep the bucket in list order: count the same-type entities before the new one.
+        bucket = self._by_type[type(object)]
+        position = sum(1 for entity in self[:self.index(object)] if type(entity) is type(object))
+        if position != len(bucket) - 1:
+            bucket.pop()
+            bucket.insert(position, object)
+
+
+    def remove(self, object:'Entity'):
+        '''Remove the first occurrence of an entity.
+        '''
+        super().remove(object)
+        self._on_remove(object)
+
+
+    def pop(self, index:int=-1) -> T:
+        '''Remove and return the entity at the given index.
+        '''
+        entity = super().pop(index)
+        self._on_remove(entity)
+        return entity
+
+
+    def count_by_type(self, entity_type:Type['Entity']) -> int:
+        '''Count the entities of the given type, from the type buckets.
+
+        Args:
+            entity_type: The type of entity to count. Subclasses match.
+        '''
+        bit = entity_type._type_bit
+        return sum(len(bucket) for cls, bucket in self._by_type.items() if cls._ancestor_mask & bit)
+
+
+    def get_by_type(self, entity_type:Type[U]) -> U|None:
+        '''Get the first entity of the given type, if any.
+
+        Args:
+            entity_type: The type of entity to get. Subclasses match.
+        '''
+        bit = entity_type._type_bit
+        heads = [bucket[0] for cls, bucket in self._by_type.items() if bucket and cls._ancestor_mask & bit]
+        if not heads:
+            return None
+        if len(heads) == 1:
+            return heads[0]
+        return min(heads, key=self.index)
+
+
+    def __contains__(self, entity:object) -> bool:
+        '''Check membership against the entity's type bucket rather than the whole list.
+        '''
+        return entity in self._by_type.get(type(entity), ())
+
+
+    def clear(self):
+        '''Remove every entity from the list.
+        '''
+        super().clear()
+        self._reindex()
     
 
     def __setitem__(self, index:int, object:'Entity'):
         '''Set an entity at the given index.
         '''
         self.on_update()
-        return super().__setitem__(index, object)
+        super().__setitem__(index, object)
+        self._reindex()
     
 
     def __delitem__(self, index:int):
         '''Delete an entity at the given index.
         '''
         self.on_update()
-        return super().__delitem__(index)
+        super().__delitem__(index)
+        self._reindex()
+
+
+    def _on_add(self, entity:'Entity'):
+        '''Register an entity that was just added to the list.
+        '''
+        bucket = self._by_type.get(type(entity))
+        if bucket is None:
+            bucket = self._by_type[type(entity)] = deque()
+        bucket.append(entity)
+        self._type_mask |= entity._ancestor_mask
+
+
+    def _on_remove(self, entity:'Entity'):
+        '''Unregister an entity that was just removed from the list.
+        '''
+        bucket = self._by_type[type(entity)]
+        bucket.remove(entity)
+        if not bucket:
+            # The last entity of this type is gone; its bits may still be set by other types.
+            self._type_mask = 0
+            for cls, bucket in self._by_type.items():
+                if bucket:
+                    self._type_mask |= cls._ancestor_mask
+
+
+    def _reindex(self):
+        '''Rebuild the indexes from scratch after a positional edit.
+        '''
+        self._by_type = {}
+        self._type_mask = 0
+        for entity in self:
+            self._on_add(entity)
     
 
     def on_update(self):
@@ -1,7 +1,6 @@
 from __future__ import annotations
-import json
 from typing import TypedDict, TypeVar, TYPE_CHECKING
-from .util import BoolWithReason, PlacementError, GamePhase
+from .util import BoolWithReason, PlacementError, GamePhase, Layer, _OK
 
 if TYPE_CHECKING:
         from .player import Player
@@ -56,6 +55,8 @@ class Game():
         self.available_pieces.append(Knight(self.available_pieces))
         #: The phase of the game.
         self.phase = GamePhase.LAND_PLACEMENT
+        # The board and citadel_version the cached winner was computed for.
+        self._winner_cache:tuple[Board, int, Player|None]|None = None
         
 
         for i in range(number_of_players):
@@ -130,7 +131,8 @@ class Game():
         Returns:
             A copy of the game.
         '''
-        return self.from_json(json.loads(json.dumps(self.to_json())))
+        # to_json builds fresh containers, so they can be loaded directly without a string round trip.
+        return self.from_json(self.to_json())
 
 
     E = TypeVar('E')
@@ -181,11 +183,21 @@ class Game():
     @property
     def winner(self) -> Player|None:
         '''The winner of the game, if any.
+
+        Only recomputed after a citadel has been added to or removed from the board.
         '''
-        has_citadels = [len(player.citadels) > 0 for player in self.players]
-        if sum(has_citadels) == 1:
-            return self.players[has_citadels.index(True)]
-        return None
+        board = self.board
+        if self._winner_cache and self._winner_cache[0] is board and self._winner_cache[1] == board.citadel_version:
+            return self._winner_cache[2]
+        winner = None
+        for player in self.players:
+            if board.count_citadels(player) > 0:
+                if winner is not None:
+                    winner = None
+                    break
+                winner = player
+        self._winner_cache = (board, board.citadel_version, winner)
+        return winner
     
 
     def _repr_html_(self) -> str:
@@ -216,28 +228,32 @@ class Game():
         if piece.owner != player:
             return BoolWithReason(f"Cannot move {piece}: not owned by player '{player.name}'.")
 
-        new_game = piece.simulate('move', target, player)
-        
-        if not new_game.board.citadels_are_connected:
+        connected = self.board.citadels_connected_after_move(piece, target.coordinate)
+        if not connected:
             return BoolWithReason(f"moving {piece} to {target} would disconnect citadels")
 
-        return BoolWithReason(True)
+        return _OK
 
 
-    def move(self, piece:'Piece', target:'Tile', player:'Player'):
+    def move(self, piece:'Piece', target:'Tile', player:'Player', validate:bool=True):
         '''Move a piece to the given tile.
 
         Args:
             piece: The piece to move.
             target: The tile to move the piece to.
             player: The player moving the piece.
+            validate: If false, skip the move checks, e.g. because the caller already ran them.
         '''
-        if self.validate_actions:
+        if validate and self.validate_actions:
             can_move = self.can_move(piece, target, player)
             if not can_move:
                 raise PlacementError(f"Cannot move {piece} to {target}: {can_move.reason}")
+            # can_move already checked that the tile accepts the piece.
+            append = target._unchecked_append
+        else:
+            append = target.append
         piece.location.remove(piece)
-        target.append(piece)
+        append(piece)
     
 
     def can_place(self, entity:'Entity', target:'Tile', player:'Player') -> BoolWithReason:
@@ -252,32 +268,37 @@ class Game():
         if not can_add_to_tile:
             return BoolWithReason(f"cannot add {entity} to {target}: {can_add_to_tile.reason}")
     
-        if not entity in player.placeable_entities:
+        if entity not in player.personal_stash and entity not in self.community_pool:
             return BoolWithReason(f"Player '{player}' does not have access to place {entity}.")
     
         if isinstance(entity, Piece) and not player.is_adjacent_to_citadel(target):
             return BoolWithReason(f"Cannot place {entity} at {target}: not adjacent to any of player's citadels.")
 
-        return BoolWithReason(True)
+        return _OK
 
 
-    def place(self, entity:'Entity', target:'Tile', player:'Player'):
+    def place(self, entity:'Entity', target:'Tile', player:'Player', validate:bool=True):
         '''Place an entity on the given tile.
 
         Args:
             entity: The entity to place.
             target: The tile to place the entity on.
+            validate: If false, skip the placement checks, e.g. because the caller already ran them.
         '''
         from .entity import Entity
         if not isinstance(entity, Entity):
             raise TypeError(f"Can only place an Entity, not {type(entity)}.")
-        if self.validate_actions:
+        if validate and self.validate_actions:
             can_place = self.can_place(entity, target, player)
             if not can_place:
                 raise PlacementError(f"Cannot place {entity} on {target}: {can_place.reason}")
+            # can_place already checked that the tile accepts the entity.
+            append = target._unchecked_append
+        else:
+            append = target.append
         entity.owner = player
         entity.location.remove(entity)
-        target.append(entity)
+        append(entity)
 
 
     def can_capture(self, entity:'Entity', target:'Tile', player:'Player') -> BoolWithReason:
@@ -292,17 +313,29 @@ class Game():
         if not (target.where(Piece) or target.where(Citadel)):
             return BoolWithReason(f"{target} has no pieces to capture.")
         
-        new_game = entity.simulate('capture', target, player)
-        if not new_game.board.citadels_are_connected:
+        captured = (target.where(Piece) + target.where(Citadel))[0]
+        if Layer.TERRAIN in (captured.layer, entity.layer) or isinstance(captured, Citadel):
+            connected = entity.simulate('capture', target, player).board.citadels_are_connected
+        else:
+            # Removing and moving non-terrain pieces can't change connectivity, so there's nothing to simulate.
+            connected = self.board.citadels_are_connected
+        if not connected:
             return BoolWithReason(f"capture at {target} would disconnect citadels")
 
-        return BoolWithReason(True)
+        return _OK
     
 
-    def capture(self, entity:Entity, target:Tile, player:Player):
-        '''Capture an entity, sending it to the graveyard.'''
+    def capture(self, entity:Entity, target:Tile, player:Player, validate:bool=True):
+        '''Capture an entity, sending it to the graveyard.
+
+        Args:
+            entity: The entity to capture with.
+            target: The tile to capture on.
+            player: The player making the capture.
+            validate: If false, skip the capture checks, e.g. because the caller already ran them.
+        '''
         from .piece import Piece, Citadel
-        if self.validate_actions:
+        if validate and self.validate_actions:
             can_capture = self.can_capture(entity, target, player)
             if not can_capture:
                 raise PlacementError(f"Cannot capture {target} with {entity}: {can_capture.reason}")
@@ -7,6 +7,12 @@ import os
 if TYPE_CHECKING:
     from .board import Tile
     from .player import Player
+
+
+_BIRD_MOVE_NOT_STRAIGHT = BoolWithReason("Bird can only move in a straight line")
+_BIRD_CAPTURE_NOT_STRAIGHT = BoolWithReason("Bird can only capture in a straight line")
+_LAND_NOT_ADJACENT = BoolWithReason("Land tile must be placed adjacent to another land tile")
+_CITADELS_NOT_CONNECTED = BoolWithReason("Citadels must be connected.")
     
 
 class Action():
@@ -15,8 +21,12 @@ class Action():
     Args:
         name: The name of the action.
         description: The description of the action.
+        action: Performs the action. Called with the target tile, the player and whether to validate the action.
+        can_use: Checks if the action can be used on the target tile by the player.
     '''
-    def __init__(self, name:str, description:str, action:Callable[[Tile, Player], None], can_use:Callable[[Tile, Player], BoolWithReason]):
+    __slots__ = ('name', 'description', 'execute', 'can_use')
+
+    def __init__(self, name:str, description:str, action:Callable[[Tile, Player, bool], None], can_use:Callable[[Tile, Player], BoolWithReason]):
         self.name = name
         self.description = description
         self.execute = action
@@ -39,7 +49,7 @@ class ActionList(dict[str, Action]):
 
 
     @overload
-    def add(self, name:str, description:str, action:Callable[[Tile, Player], None], can_use:Callable[[Tile, Player], BoolWithReason]):
+    def add(self, name:str, description:str, action:Callable[[Tile, Player, bool], None], can_use:Callable[[Tile, Player], BoolWithReason]):
         '''Add an action to the list.
         
         Args:
@@ -79,9 +89,11 @@ class ActionList(dict[str, Action]):
 class Piece(Entity):
     '''The primary moveable entity in the game.
     '''
+    __slots__ = ()
 
 
 class Bird(Piece):
+    __slots__ = ()
     abbreviation = "🐦"
     img = "bird.png"
 
@@ -99,9 +111,8 @@ class Bird(Piece):
         if self.board != target.board:
             return BoolWithReason(f"{self} is not on the board with {target}")
 
-        movement = self.get_vector_to(target)
-        if not movement.is_straight():
-            return BoolWithReason("Bird can only move in a straight line")
+        if not self.coordinate.is_in_line_with(target.coordinate):
+            return _BIRD_MOVE_NOT_STRAIGHT
 
         return self.game.can_move(self, target, player)
     
@@ -111,21 +122,33 @@ class Bird(Piece):
         if self.board != target.board:
             return BoolWithReason(f"{self} is not on the board with {target}")
 
-        movement = self.get_vector_to(target)
-        if not movement.is_straight():
-            return BoolWithReason("Bird can only capture in a straight line")
+        if not self.coordinate.is_in_line_with(target.coordinate):
+            return _BIRD_CAPTURE_NOT_STRAIGHT
         
         return self.game.can_capture(self, target, player)
     
 
-    def capture(self, target, player):
+    def get_candidate_tiles(self, action_name:str) -> list[Tile]:
+        # Moves and captures stay in this piece's row or column.
+        coordinate = self.coordinate
+        if action_name not in ("move", "capture") or coordinate is None:
+            return super().get_candidate_tiles(action_name)
+        board = self.game.board
+        extents = board.extents
+        line = [Coordinate(x, coordinate.y) for x in range(extents.x_min, extents.x_max + 1)]
+        line += [Coordinate(coordinate.x, y) for y in range(extents.y_min, extents.y_max + 1) if y != coordinate.y]
+        return [tile for tile in map(board.get, line) if tile is not None]
+    
+
+    def capture(self, target, player, validate=True):
         # The Bird takes the place of the captured piece when it captures.
-        super().capture(target, player)
-        self.move(target, player)
+        super().capture(target, player, validate)
+        self.move(target, player, validate)
 
         
 
 class Knight(Piece):
+    __slots__ = ()
     abbreviation = "♞"
     img = "shield.png"
     
@@ -141,16 +164,16 @@ class Knight(Piece):
         # The Knight moves one square at a time, either orthogonally (up, down, left, right) or diagonally.
         if self.board != target.board:
             return BoolWithReason(f"{self} is not on the board with {target}")
-        if not target.coordinate in self.coordinate.get_adjacent_coordinates():
+        if not self.coordinate.is_adjacent_to(target.coordinate):
             return BoolWithReason(f"{self} can only move one square at a time")
 
         return self.game.can_move(self, target, player)
 
 
-    def capture(self, target, player):
+    def capture(self, target, player, validate=True):
         # The Knight takes the place of the captured piece.
-        super().capture(target, player)
-        self.move(target, player)
+        super().capture(target, player, validate)
+        self.move(target, player, validate)
     
 
     def can_capture(self, target:Tile, player:Player) -> BoolWithReason:
@@ -158,14 +181,29 @@ class Knight(Piece):
         if self.board != target.board:
             return BoolWithReason(f"{self} is not the board with {target}")
         
-        if not target.coordinate in self.coordinate.get_adjacent_coordinates():
+        if not self.coordinate.is_adjacent_to(target.coordinate):
             return BoolWithReason(f"{self} cannot capture at {target}; it is more than one square away")
 
         return self.game.can_capture(self, target, player)
+
+
+    def get_candidate_tiles(self, action_name:str) -> list[Tile]:
+        # Moves and captures only reach the eight surrounding tiles.
+        coordinate = self.coordinate
+        if action_name not in ("move", "capture") or coordinate is None:
+            return super().get_candidate_tiles(action_name)
+        board = self.game.board
+        tiles = []
+        for adjacent in coordinate.get_adjacent_coordinates():
+            tile = board.get(adjacent)
+            if tile is not None:
+                tiles.append(tile)
+        return tiles
         
 
 
 class Turtle(Piece):
+    __slots__ = ()
     layer = Layer.TERRAIN
     abbreviation = "🐢"
     img = "turtle.png"
@@ -175,6 +213,7 @@ class Turtle(Piece):
 
 
 class Rabbit(Piece):
+    __slots__ = ()
     abbreviation = "🐇"
     img = "rabbit.png"
     
@@ -183,6 +222,7 @@ class Rabbit(Piece):
 
 
 class Builder(Piece):
+    __slots__ = ()
     abbreviation = "🙎"
     img = "pickaxe.png"
     
@@ -191,6 +231,7 @@ class Builder(Piece):
 
 
 class Bomber(Piece):
+    __slots__ = ()
     abbreviation = "💣"
     img = "bomb.png"
     
@@ -199,6 +240,7 @@ class Bomber(Piece):
 
 
 class Necromancer(Piece):
+    __slots__ = ()
     abbreviation = "🧙‍♂️"
     img = "skull.png"
     
@@ -207,6 +249,7 @@ class Necromancer(Piece):
 
 
 class Assassin(Piece):
+    __slots__ = ()
     abbreviation = "🗡️"
     img = "crosshair.png"
     
@@ -230,6 +273,7 @@ all_pieces = [
 class Land(Entity):
     '''A land entity. Most pieces are placed on tiles with land.
     '''
+    __slots__ = ()
     color = None
     layer = Layer.TERRAIN
 
@@ -269,11 +313,12 @@ class Land(Entity):
         tile:Tile = self.location.board[self.location.coordinate + direction]
         if not tile.has_type(Land):
             return 0
-        adjacent = tile.get_adjacent_tiles()
-        water = len([t for t in adjacent if t.is_water])
-        if water == 0:
-            return 2
-        return 1
+        board = self.location.board
+        for coordinate in tile.coordinate.get_adjacent_coordinates():
+            adjacent = board.get(coordinate)
+            if adjacent is None or adjacent.is_water:
+                return 1
+        return 2
 
 
     def actions(self, target:Tile, player:Player) -> ActionList:
@@ -283,12 +328,14 @@ class Land(Entity):
     
 
     def can_place(self, target:Tile, player:Player) -> BoolWithReason:
-
-        is_adjacent_to_land = any([tile.has_type(Land) for tile in target.get_adjacent_tiles()])
-        board_has_no_land = len(self.game.board.where(Land)) == 0
-
-        if not (is_adjacent_to_land or board_has_no_land):
-            return BoolWithReason("Land tile must be placed adjacent to another land tile")
+        # The first land can go anywhere; after that, land must be adjacent to existing land.
+        for coordinate in target.coordinate.get_adjacent_coordinates():
+            tile = target.board.get(coordinate)
+            if tile is not None and tile.has_type(Land):
+                break
+        else:
+            if self.game.board.has_type(Land):
+                return _LAND_NOT_ADJACENT
 
         return self.game.can_place(self, target, player)
 
@@ -297,6 +344,7 @@ class Land(Entity):
 class Citadel(Entity):
     '''A citadel. Citadels spawn pieces. Capturing a citadel is the primary goal of the game.
     '''
+    __slots__ = ()
     abbreviation = "⛃"
     img = "building-2.png"
 
@@ -309,10 +357,7 @@ class Citadel(Entity):
 
     def can_place(self, target:Tile, player:Player) -> BoolWithReason:
         # Citadels must be placed such that all citadels remain connected.
-        
-        new_game = self.simulate('place', target, player)
-
-        if not new_game.board.citadels_are_connected:
-            return BoolWithReason("Citadels must be connected.")
+        if not target.board.citadels_connected_with(target.coordinate):
+            return _CITADELS_NOT_CONNECTED
         
         return self.game.can_place(self, target, player)
\ No newline at end of file
@@ -54,6 +54,12 @@ class Player():
         from .entity import EntityList
         player = cls(json_data['name'], game, tuple(json_data['color']))
         player.personal_stash = EntityList.from_json(json_data['personal_stash'], game)
+        # The stash is resolved against game.players, which doesn't hold this player yet.
+        for entity in player.personal_stash:
+            if entity.created_by and entity.created_by.name == player.name:
+                entity.created_by = player
+            if entity.owner and entity.owner.name == player.name:
+                entity.owner = player
         player.rotation = json_data['rotation']
         return player
 
@@ -88,16 +94,14 @@ class Player():
     def is_done_choosing_personal_pieces(self) -> bool:
         '''True if the player has chosen all of their personal pieces.
         '''
-        personal_pieces = self.personal_stash.where(Piece)
-        return len(personal_pieces) >= self.game.personal_pieces_per_player
+        return self.personal_stash.count_by_type(Piece) >= self.game.personal_pieces_per_player
 
 
     @property
     def is_done_choosing_community_pieces(self) -> bool:
         '''True if the player has chosen all of their community pieces.
         '''
-        community_pieces = self.community_entities.where(Piece)
-        return len(community_pieces) >= self.game.community_pieces_per_player
+        return len(self.community_entities) >= self.game.community_pieces_per_player
 
 
     @property
@@ -124,7 +128,7 @@ class Player():
         '''Choose a piece for the personal stash.
         '''
         if self.is_done_choosing_personal_pieces:
-            raise ValueError(f"Players are not allowed to choose more than {self.game.personal_pieces_per_player} pieces for their personal stash. '{self.name}' has already chosen {len(self.personal_stash.where(Piece))} personal pieces.")
+            raise ValueError(f"Players are not allowed to choose more than {self.game.personal_pieces_per_player} pieces for their personal stash. '{self.name}' has already chosen {self.personal_stash.count_by_type(Piece)} personal pieces.")
         
         if isinstance(piece, type):
             piece = piece(self.personal_stash, self, self)
@@ -138,19 +142,15 @@ class Player():
     def land_tiles(self) -> 'EntityList[Land]':
         '''The land tiles this player has placed.
         '''
-        from .entity import EntityList
-        player_lands = EntityList(self.game)
-        for tile in self.game.board.values():
-            if tile.land and tile.land.created_by == self:
-                player_lands.append(tile.land)
-        return player_lands
+        from .piece import Land
+        return self.game.board.where(Land, created_by=self)
     
 
     @property
     def is_done_placing_lands(self) -> bool:
         '''True if the player has placed all of their lands.
         '''
-        return len(self.land_tiles) >= self.game.lands_per_player
+        return self.game.board.count_lands(self) >= self.game.lands_per_player
     
 
     @property
@@ -165,7 +165,7 @@ class Player():
     def is_done_placing_citadels(self) -> bool:
         '''True if the player has placed all of their citadels.
         '''
-        return len(self.citadels) >= self.game.citadels_per_player
+        return self.game.board.count_citadels(self) >= self.game.citadels_per_player
 
     
     def is_adjacent_to_citadel(self, to_test:Coordinate|Tile|Entity) -> bool:
@@ -182,9 +182,10 @@ class Player():
             coordinate = to_test.coordinate
         elif isinstance(to_test, Entity):
             coordinate = self.game.board.get_coordinate_of_entity(to_test)
+        if coordinate is None:
+            return False
         for citadel in self.citadels:
-            citadel_coordinate = self.game.board.get_coordinate_of_entity(citadel)
-            if coordinate in citadel_coordinate.get_adjacent_coordinates():
+            if self.game.board.get_coordinate_of_entity(citadel).is_adjacent_to(coordinate):
                 return True
         return False
     
@@ -236,10 +237,10 @@ class Player():
         if isinstance(obj, Entity):
             return obj
         if isinstance(obj, type):
-            entities = self.personal_stash.where(obj)
-            if not entities:
+            entity = self.personal_stash.get_by_type(obj)
+            if entity is None:
                 raise ActionError(f"Entity '{obj}' not found in personal stash.")
-            return entities[0]
+            return entity
 
 
     def can_perform_action(self, entity:'Entity'|Type['Entity'], action_name:str, target:Coordinate|Tile|Entity) -> BoolWithReason:
@@ -281,7 +282,8 @@ class Player():
                 raise ActionError(can_perform.reason)
         action = entity.actions(target, self)[action_name]
         old_location = entity.location
-        action.execute(target, self)
+        # The action's can_use already ran the game-level checks, so Game.move/place/capture don't repeat them.
+        action.execute(target, self, False)
         entity.game.board.on_update()
         entity.location.on_update()
         old_location.on_update()
@@ -1,10 +1,13 @@
 from typing import Literal
 from enum import Enum
+from functools import lru_cache
 from typing import NamedTuple, Iterator, Self
 
 class BoolWithReason():
     '''A string that can be used as a boolean with a reason.
     '''
+    __slots__ = ('reason', 'value')
+
     def __init__(self, value:Literal[True]|str):
         '''Create a new BoolWithReason.
 
@@ -25,6 +28,10 @@ class BoolWithReason():
         return f"BoolWithReason({self.value or self.reason})"
 
 
+# Shared success result, returned by the can_* checks instead of allocating a new one.
+_OK = BoolWithReason(True)
+
+
 class Layer(Enum):
     '''The layer of an entity.'''
     TERRAIN = 0
@@ -54,36 +61,47 @@ class Coordinate(NamedTuple):
 
 
     def to_json(self) -> str:
-        return f"{self.x},{self.y}"
+        return _coordinate_key(self)
     
 
     @classmethod
     def from_json(cls, json_data:str) -> 'Coordinate':
-        x, y = json_data.split(',')
-        return cls(int(x), int(y))
+        coordinate = _parse_coordinate(json_data)
+        return coordinate if cls is Coordinate else cls(*coordinate)
     
 
-    def get_adjacent_coordinates(self, orthagonal:bool=True, diagonal:bool=True) -> list['Coordinate']:
+    def is_adjacent_to(self, other:'Coordinate') -> bool:
+        '''Check if another coordinate is one of the eight coordinates around this one.
+
+        Args:
+            other: The coordinate to check.
+        '''
+        dx = other.x - self.x
+        dy = other.y - self.y
+        return -1 <= dx <= 1 and -1 <= dy <= 1 and bool(dx or dy)
+
+
+    def is_in_line_with(self, other:'Coordinate') -> bool:
+        '''Check if another coordinate shares this coordinate's row or column.
+
+        Args:
+            other: The coordinate to check.
+        '''
+        return self.x == other.x or self.y == other.y
+
+
+    def get_adjacent_coordinates(self, orthagonal:bool=True, diagonal:bool=True) -> tuple['Coordinate', ...]:
         '''Get the coordinates adjacent to this coordinate.
 
+        The result is cached per coordinate and shared between callers.
+
         Args:
             orthagonal: If True, include orthagonal coordinates.
             diagonal: If True, include diagonal coordinates.
         '''
         if not orthagonal and not diagonal:
             raise ValueError("At least one of orthagonal or diagonal must be True.")
-        coordinates = []
-        if orthagonal:
-            coordinates.append(Coordinate(self.x-1, self.y))
-            coordinates.append(Coordinate(self.x+1, self.y))
-            coordinates.append(Coordinate(self.x, self.y-1))
-            coordinates.append(Coordinate(self.x, self.y+1))
-        if diagonal:
-            coordinates.append(Coordinate(self.x-1, self.y-1))
-            coordinates.append(Coordinate(self.x-1, self.y+1))
-            coordinates.append(Coordinate(self.x+1, self.y-1))
-            coordinates.append(Coordinate(self.x+1, self.y+1))
-        return coordinates
+        return _adjacent_coordinates(self, orthagonal, diagonal)
     
     def __sub__(self, other:'Coordinate') -> 'Coordinate':
         '''Subtract two coordinates.'''
@@ -98,6 +116,40 @@ class Coordinate(NamedTuple):
 
 
 
+_ORTHAGONAL_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_DIAGONAL_OFFSETS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+_ADJACENT_OFFSETS = _ORTHAGONAL_OFFSETS + _DIAGONAL_OFFSETS
+
+# The caches below are bounded, since games parsed from arbitrary JSON can reach any coordinate.
+_COORDINATE_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=_COORDINATE_CACHE_SIZE)
+def _coordinate(x:int, y:int) -> Coordinate:
+    '''Get a shared Coordinate instance for (x, y).'''
+    return Coordinate(x, y)
+
+
+@lru_cache(maxsize=_COORDINATE_CACHE_SIZE)
+def _adjacent_coordinates(coordinate:Coordinate, orthagonal:bool, diagonal:bool) -> tuple[Coordinate, ...]:
+    '''Build the coordinates adjacent to a coordinate; see Coordinate.get_adjacent_coordinates.'''
+    offsets = _ADJACENT_OFFSETS if orthagonal and diagonal else _ORTHAGONAL_OFFSETS if orthagonal else _DIAGONAL_OFFSETS
+    return tuple(_coordinate(coordinate.x+dx, coordinate.y+dy) for dx, dy in offsets)
+
+
+# Serialized keys in both directions, since every game copy round-trips the whole board through them.
+@lru_cache(maxsize=_COORDINATE_CACHE_SIZE)
+def _coordinate_key(coordinate:Coordinate) -> str:
+    '''Format a coordinate as its JSON key.'''
+    return f"{coordinate.x},{coordinate.y}"
+
+
+@lru_cache(maxsize=_COORDINATE_CACHE_SIZE)
+def _parse_coordinate(key:str) -> Coordinate:
+    '''Parse a JSON key back into a shared Coordinate.'''
+    x, y = map(int, key.split(','))
+    return _coordinate(x, y)
+
+
 class Rectangle(NamedTuple):
     '''A rectangle on the board.'''
     x_min: int
@@ -43,14 +43,14 @@ class ExampleGame():
     
     def place_citadels(self) -> Game:
         player0, player1 = self.game.players
-        player0.place(player0.personal_stash.where(Citadel)[0], self.game.board[Coordinate(2, 0)])
-        player1.place(player1.personal_stash.where(Citadel)[0], self.game.board[Coordinate(0, 3)])
+        player0.place(player0.personal_stash.get_by_type(Citadel), self.game.board[Coordinate(2, 0)])
+        player1.place(player1.personal_stash.get_by_type(Citadel), self.game.board[Coordinate(0, 3)])
         return self.game
     
     def place_pieces(self) -> Game:
         player0, player1 = self.game.players
-        player0.place(player0.personal_stash.where(Knight)[0], self.game.board[Coordinate(1, 0)])
-        player1.place(player1.personal_stash.where(Bird)[0], self.game.board[Coordinate(0, 2)])
+        player0.place(player0.personal_stash.get_by_type(Knight), self.game.board[Coordinate(1, 0)])
+        player1.place(player1.personal_stash.get_by_type(Bird), self.game.board[Coordinate(0, 2)])
         return self.game
     
     def setup_full_game(self) -> Game:
@@ -60,6 +60,15 @@ class ExampleGame():
         self.choose_community_pieces()
         self.place_pieces()
         return self.game
+    
+    _full_game:Game|None = None
+
+    @classmethod
+    def full_game(cls) -> Game:
+        '''A copy of a fully set up game. The setup is only played out once.'''
+        if cls._full_game is None:
+            cls._full_game = cls().setup_full_game()
+        return cls._full_game.copy()
 
 
 def test_create_game():
@@ -188,6 +197,28 @@ def test_place_land(game:Game|None=None):
     assert game.board[Coordinate(2, 2)].is_water
 
 
+def test_board_where_order():
+    game = ExampleGame.full_game()
+    board = game.board
+
+    bird_tile = board[Coordinate(0, 2)]
+    bird = bird_tile.get_by_type(Bird)
+    bird_tile.remove(bird)
+    bird_tile.append(bird)
+
+    expected = [entity for tile in board.values() for entity in tile if isinstance(entity, Piece)]
+    assert board.where(Piece) == expected, "Entities should be returned in board order, not the order they were added."
+    assert board.find_tiles(Piece) == [board[entity.coordinate] for entity in expected]
+
+    # A tile that is removed and added again goes to the end of the board.
+    land = board[Coordinate(0, 0)].get_by_type(Land)
+    board.remove(land)
+    board.place(land, Coordinate(0, 0))
+    assert list(board)[-1] == Coordinate(0, 0)
+    expected = [entity for tile in board.values() for entity in tile if isinstance(entity, Land)]
+    assert board.where(Land) == expected
+
+
 def test_copy_entity_list():
     example = ExampleGame()
     example.place_lands()
@@ -270,7 +301,7 @@ def test_place_pieces():
     example.place_citadels()
     player0, player1 = game.players
 
-    player0knight:Knight = player0.personal_stash.where(Knight)[0]
+    player0knight:Knight = player0.personal_stash.get_by_type(Knight)
 
     try:
         player0.perform_action(player0knight, 'place', Coordinate(2, 0))
@@ -300,7 +331,7 @@ def test_place_pieces():
 
 
 def test_move_pieces():
-    game = ExampleGame().setup_full_game()
+    game = ExampleGame.full_game()
     player0, player1 = game.players
 
     player0knight:Knight = game.board.where(Knight, owner=player0)[0]
@@ -320,13 +351,14 @@ def test_move_pieces():
 
 
 def test_capture_pieces():
-    game = ExampleGame().setup_full_game()
+    game = ExampleGame.full_game()
     player0, player1 = game.players
 
     player0knight:Knight = game.board.where(Knight, owner=player0)[0]
     player1bird:Bird = game.board.where(Bird, owner=player1)[0]
 
     player0.move(player0knight, game.board[Coordinate(0, 0)])
+    assert game.validate_actions, "Performing an action should not turn off the game's validation."
 
     player1.capture(player1bird, Coordinate(0, 0))
     target_tile = game.board[Coordinate(0, 0)]
@@ -338,6 +370,8 @@ def test_capture_pieces():
     assert player1bird.owner == player1
     assert player0knight not in game.board[Coordinate(0, 0)]
     assert player0knight.location == game.graveyard
+    assert not game.board.where(Knight, owner=player0), "The captured knight is still indexed on the board."
+    assert game.board.get_coordinate_of_entity(player1bird) == Coordinate(0, 0)
 
 
 def test_entity_list_where():
@@ -392,8 +426,18 @@ def test_board_json():
     assert new_board[Coordinate(0, 0)].to_json() == board[Coordinate(0, 0)].to_json(), "The tile in the new board is not the same as the original."
 
 
+def test_player_json():
+    game = ExampleGame.full_game()
+    player0 = game.players[0]
+
+    new_player = Player.from_json(player0.to_json(), game)
+    assert len(new_player.personal_stash) == len(player0.personal_stash)
+    assert all(entity.owner is new_player for entity in new_player.personal_stash), "The stash should be owned by the loaded player."
+    assert all(entity.created_by is new_player for entity in new_player.personal_stash), "The stash should be created by the loaded player."
+
+
 def test_game_json():
-    game = ExampleGame().setup_full_game()
+    game = ExampleGame.full_game()
     game_json = game.to_json()
 
     new_game = Game.from_json(game_json)
@@ -405,10 +449,11 @@ def test_game_json():
     assert len(new_game.community_pool) == len(game.community_pool), "The number of entities in the community pool in the new game is not correct."
     assert new_game.board[Coordinate(0, 0)].to_json() == game.board[Coordinate(0, 0)].to_json(), "The tile in the new board is not the same as the original."
     assert new_game.board.where(Knight)[0].to_json() == game.board.where(Knight)[0].to_json(), "The knight in the new board is not the same as the original."
+    assert all(entity.owner is new_game.players[0] for entity in new_game.players[0].personal_stash), "The personal stash should be owned by the loaded player, not a stale one."
 
 
 def test_knight_can_move():
-    game = ExampleGame().setup_full_game()
+    game = ExampleGame.full_game()
     player0, player1 = game.players
 
     player0knight:Knight = game.board.where(Knight, owner=player0)[0]
@@ -428,7 +473,7 @@ def test_knight_can_move():
 
 
 def test_get_tiles_by_action():
-    game = ExampleGame().setup_full_game()
+    game = ExampleGame.full_game()
     player0, player1 = game.players
 
     player0knight:Knight = game.board.where(Knight, owner=player0)[0]
@@ -440,8 +485,18 @@ def test_get_tiles_by_action():
     assert len(player0knight.get_tiles_by_action('place')) == 0, "The number of tiles for the place action is not correct."
 
 
+def test_bird_candidate_tiles():
+    game = ExampleGame.full_game()
+    bird = game.board.where(Bird)[0]
+
+    candidates = [tile.coordinate for tile in bird.get_candidate_tiles('move')]
+    expected = [tile.coordinate for tile in game.board.values() if bird.coordinate.is_in_line_with(tile.coordinate)]
+    assert sorted(candidates) == sorted(expected), "A Bird's candidates should be every tile in its row and column."
+    assert len(candidates) == len(set(candidates)), "The Bird's own tile should only be a candidate once."
+
+
 def test_get_tile_by_tuple():
-    game = ExampleGame().setup_full_game()
+    game = ExampleGame.full_game()
     
     tile = game.board[(0, 0)]
 
@@ -450,7 +505,7 @@ def test_get_tile_by_tuple():
 
 
 def test_fancy_land():
-    game = ExampleGame().setup_full_game()
+    game = ExampleGame.full_game()
 
     land14 = game.board[Coordinate(1, 4)].where(Land)[0]
     elevation = land14.get_edge_elevation(Coordinate(1, 0))
@@ -462,4 +517,120 @@ def test_fancy_land():
     elevation = land03.get_edge_elevation(Coordinate(0, -1))
     assert elevation == 1
     img = land03.img
-    assert img == 'beach0001.png'
\ No newline at end of file
+    assert img == 'beach0001.png'
+
+
+def test_entity_list_get_by_type():
+    game = Game()
+    el = EntityList(game)
+    first_knight = Knight(el)
+    bird = Bird(el)
+    second_knight = Knight(el)
+    for entity in (first_knight, bird, second_knight):
+        el.append(entity)
+
+    assert el.get_by_type(Piece) is first_knight
+    assert el.has_type(Bird) and not el.has_type(Land)
+    assert el.get_by_type(Land) is None
+    el.remove(first_knight)
+    assert el.get_by_type(Piece) is bird, "The earliest Piece in the list should be found first."
+    el.remove(bird)
+    assert el == [second_knight]
+    assert el.where(Knight) == [second_knight]
+
+
+def test_entity_list_insert():
+    game = Game()
+    el = EntityList(game)
+    first_knight, bird, last_knight = Knight(el), Bird(el), Knight(el)
+    for entity in (first_knight, bird, last_knight):
+        el.append(entity)
+
+    middle_knight = Knight(el)
+    el.insert(1, middle_knight)
+    assert el == [first_knight, middle_knight, bird, last_knight]
+    assert el.where(Knight) == [first_knight, middle_knight, last_knight]
+    assert el.get_by_type(Knight) is first_knight
+
+    front_knight = Knight(el)
+    el.insert(0, front_knight)
+    assert el.get_by_type(Knight) is front_knight, "An entity inserted at the front should be found first."
+    assert el.get_by_type(Piece) is front_knight
+
+    front_bird = Bird(el)
+    el.insert(2, front_bird)
+    assert el.where(Bird) == [front_bird, bird]
+    assert el.where(Piece) == el
+    el.remove(front_knight)
+    el.remove(first_knight)
+    assert el.get_by_type(Piece) is front_bird
+
+
+def test_citadels_are_connected():
+    example = ExampleGame()
+    example.place_lands()
+    example.place_citadels()
+    board = example.game.board
+
+    assert board.citadels_are_connected
+    assert board.citadels_connected_with(Coordinate(0, 0))
+    assert not board.citadels_connected_with(Coordinate(1, 4)), "(1, 4) is an island; a citadel there would be disconnected."
+
+    board.remove(board[Coordinate(0, 1)].land)
+    assert board.citadels_are_connected, "The citadels are still connected around the removed land."
+    board.remove(board[Coordinate(0, 2)].land)
+    assert not board.citadels_are_connected, "Removing the only land between the citadels should disconnect them."
+
+
+def test_citadels_connected_after_move():
+    game = ExampleGame.full_game()
+    board = game.board
+    player0, player1 = game.players
+
+    citadel_version = board.citadel_version
+    lands = board.where(Land)
+    land_index = list(board._by_type[Land])
+
+    land = board[Coordinate(0, 2)].land
+    assert not board.citadels_connected_after_move(land, Coordinate(5, 5)), "(0, 2) is the only land next to player 1's citadel."
+    assert board.citadels_connected_after_move(land, Coordinate(1, 3)), "A land at (1, 3) still joins (0, 3) to (1, 2)."
+    assert board.citadels_connected_after_move(board[Coordinate(0, 1)].land, Coordinate(5, 5))
+
+    citadel = player1.citadels[0]
+    assert not game.can_move(citadel, board[Coordinate(1, 4)], player1), "(1, 4) is an island."
+    assert game.can_move(citadel, board[Coordinate(0, 1)], player1)
+
+    assert board.citadel_version == citadel_version, "Checking a move should not change the board."
+    assert list(board._by_type[Land]) == land_index
+    assert board.where(Land) == lands
+
+
+def test_is_adjacent_to_citadel():
+    game = ExampleGame.full_game()
+    player0 = game.players[0]
+
+    assert player0.is_adjacent_to_citadel(Coordinate(2, 1))
+    assert not player0.is_adjacent_to_citadel(Coordinate(0, 0))
+    knight = player0.personal_stash.get_by_type(Knight)
+    assert not player0.is_adjacent_to_citadel(knight), "An entity that is not on the board is not adjacent to anything."
+
+
+def test_winner():
+    game = ExampleGame.full_game()
+    player0, player1 = game.players
+
+    assert game.winner is None
+    game.board.remove(player1.citadels[0])
+    assert game.winner == player0, "Player 0 should win once Player 1 has no citadels left."
+
+
+def test_extents():
+    example = ExampleGame()
+    board = example.game.board
+    assert board.extents == Rectangle(0, 0, 0, 0)
+
+    example.place_lands()
+    assert board.extents == Rectangle(0, 2, 0, 4)
+
+    board.remove(board[Coordinate(1, 4)].land)
+    assert board.extents == Rectangle(0, 2, 0, 3), "Removing the only tile at y=4 should shrink the extents."